@@ -54,6 +54,21 @@ Version: 0.1.0
 
 from .base import (
     AVAILABLE_HOOKS,
+    HOOK_ANALYZE,
+    HOOK_ON_CACHE_HIT,
+    HOOK_ON_CACHE_MISS,
+    HOOK_ON_ERROR,
+    HOOK_ON_SHUTDOWN,
+    HOOK_ON_STARTUP,
+    HOOK_ON_TIMEOUT,
+    HOOK_POST_ANALYZE,
+    HOOK_POST_FORMAT,
+    HOOK_POST_LOAD,
+    HOOK_POST_SEARCH,
+    HOOK_PRE_ANALYZE,
+    HOOK_PRE_FORMAT,
+    HOOK_PRE_LOAD,
+    HOOK_PRE_SEARCH,
     HOOK_TYPES,
     AnalyzerPlugin,
     CachePlugin,
@@ -92,4 +107,19 @@ __all__ = [
     # Constants
     "HOOK_TYPES",
     "AVAILABLE_HOOKS",
+    "HOOK_PRE_LOAD",
+    "HOOK_POST_LOAD",
+    "HOOK_ON_TIMEOUT",
+    "HOOK_PRE_SEARCH",
+    "HOOK_POST_SEARCH",
+    "HOOK_PRE_FORMAT",
+    "HOOK_POST_FORMAT",
+    "HOOK_PRE_ANALYZE",
+    "HOOK_ANALYZE",
+    "HOOK_POST_ANALYZE",
+    "HOOK_ON_STARTUP",
+    "HOOK_ON_SHUTDOWN",
+    "HOOK_ON_ERROR",
+    "HOOK_ON_CACHE_HIT",
+    "HOOK_ON_CACHE_MISS",
 ]
@@ -36,12 +36,48 @@ Version: 0.1.0
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Final
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Hook names, shared by plugin metadata, the registry and callers
+HOOK_PRE_LOAD: Final = "pre_load"
+HOOK_POST_LOAD: Final = "post_load"
+HOOK_ON_TIMEOUT: Final = "on_timeout"
+HOOK_PRE_SEARCH: Final = "pre_search"
+HOOK_POST_SEARCH: Final = "post_search"
+HOOK_PRE_FORMAT: Final = "pre_format"
+HOOK_POST_FORMAT: Final = "post_format"
+HOOK_PRE_ANALYZE: Final = "pre_analyze"
+HOOK_ANALYZE: Final = "analyze"
+HOOK_POST_ANALYZE: Final = "post_analyze"
+HOOK_ON_STARTUP: Final = "on_startup"
+HOOK_ON_SHUTDOWN: Final = "on_shutdown"
+HOOK_ON_ERROR: Final = "on_error"
+HOOK_ON_CACHE_HIT: Final = "on_cache_hit"
+HOOK_ON_CACHE_MISS: Final = "on_cache_miss"
+
+# Names of every extension point; see HOOK_TYPES for the owning plugin class
+_HOOK_NAMES = (
+    HOOK_PRE_LOAD,
+    HOOK_POST_LOAD,
+    HOOK_ON_TIMEOUT,
+    HOOK_PRE_SEARCH,
+    HOOK_POST_SEARCH,
+    HOOK_PRE_FORMAT,
+    HOOK_POST_FORMAT,
+    HOOK_PRE_ANALYZE,
+    HOOK_ANALYZE,
+    HOOK_POST_ANALYZE,
+    HOOK_ON_STARTUP,
+    HOOK_ON_SHUTDOWN,
+    HOOK_ON_ERROR,
+    HOOK_ON_CACHE_HIT,
+    HOOK_ON_CACHE_MISS,
+)
+
+
+@dataclass(slots=True)
 class PluginMetadata:
     """
     Plugin metadata for registration.
@@ -100,6 +136,16 @@ class PluginBase(ABC):
                 print(f"Plugin loaded: {self.metadata.name}")
     """
 
+    # Hook names this class implements, computed once per subclass; the
+    # registry falls back to getattr() for hooks added to the class later
+    _hook_methods: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._hook_methods = frozenset(
+            name for name in _HOOK_NAMES if callable(getattr(cls, name, None))
+        )
+
     @property
     @abstractmethod
     def metadata(self) -> PluginMetadata:
@@ -549,27 +595,27 @@ class CachePlugin(PluginBase):
 # Hook type definitions
 HOOK_TYPES = {
     # Loader hooks
-    "pre_load": LoaderPlugin,
-    "post_load": LoaderPlugin,
-    "on_timeout": LoaderPlugin,
+    HOOK_PRE_LOAD: LoaderPlugin,
+    HOOK_POST_LOAD: LoaderPlugin,
+    HOOK_ON_TIMEOUT: LoaderPlugin,
     # Search hooks
-    "pre_search": SearchPlugin,
-    "post_search": SearchPlugin,
+    HOOK_PRE_SEARCH: SearchPlugin,
+    HOOK_POST_SEARCH: SearchPlugin,
     # Format hooks
-    "pre_format": FormatterPlugin,
-    "post_format": FormatterPlugin,
+    HOOK_PRE_FORMAT: FormatterPlugin,
+    HOOK_POST_FORMAT: FormatterPlugin,
     # Analyzer hooks
-    "pre_analyze": AnalyzerPlugin,
-    "analyze": AnalyzerPlugin,
-    "post_analyze": AnalyzerPlugin,
+    HOOK_PRE_ANALYZE: AnalyzerPlugin,
+    HOOK_ANALYZE: AnalyzerPlugin,
+    HOOK_POST_ANALYZE: AnalyzerPlugin,
     # Lifecycle hooks
-    "on_startup": LifecyclePlugin,
-    "on_shutdown": LifecyclePlugin,
+    HOOK_ON_STARTUP: LifecyclePlugin,
+    HOOK_ON_SHUTDOWN: LifecyclePlugin,
     # Error hooks
-    "on_error": ErrorPlugin,
+    HOOK_ON_ERROR: ErrorPlugin,
     # Cache hooks
-    "on_cache_hit": CachePlugin,
-    "on_cache_miss": CachePlugin,
+    HOOK_ON_CACHE_HIT: CachePlugin,
+    HOOK_ON_CACHE_MISS: CachePlugin,
 }
 
 AVAILABLE_HOOKS = list(HOOK_TYPES.keys())
@@ -13,8 +13,10 @@ Version: 0.1.0
 
 import importlib.util
 import logging
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from threading import Lock
+from types import ModuleType
 from typing import Any, Optional
 
 from .base import (
@@ -76,6 +78,13 @@ class PluginRegistry:
         self._hooks: dict[str, list[PluginBase]] = {
             hook: [] for hook in AVAILABLE_HOOKS
         }
+        # Resolved (plugin, bound class method) pairs per hook, rebuilt lazily
+        # after any registry change that can affect hook membership
+        self._hook_index: dict[
+            str, list[tuple[PluginBase, Callable[..., Any] | None]]
+        ] = {}
+        self._hook_plugins: dict[str, tuple[PluginBase, ...]] = {}
+        self._chain_reducers: dict[str, Callable[..., Any]] = {}
         self._loaded_modules: dict[str, Any] = {}
         self._initialized = True
 
@@ -97,11 +106,58 @@ class PluginRegistry:
             The `plugins.loader.cache_enabled` setting acts as a master toggle
             for the content_cache plugin.
         """
+        hooks = self._add_plugin(plugin)
+        if hooks is None:
+            return False
+
+        self._sort_hooks(hooks)
+        self._invalidate_hooks()
+        self._finish_registration(plugin)
+        return True
+
+    def register_many(self, plugins: Iterable[PluginBase]) -> int:
+        """
+        Register several plugins at once.
+
+        Hook lists are sorted and hook dispatch caches rebuilt once for the
+        whole batch rather than after every plugin.
+
+        Args:
+            plugins: Plugin instances to register
+
+        Returns:
+            Number of plugins registered (duplicates are skipped)
+        """
+        added: list[PluginBase] = []
+        touched: set[str] = set()
+
+        for plugin in plugins:
+            hooks = self._add_plugin(plugin)
+            if hooks is not None:
+                added.append(plugin)
+                touched.update(hooks)
+
+        if added:
+            self._sort_hooks(touched)
+            self._invalidate_hooks()
+            for plugin in added:
+                self._finish_registration(plugin)
+
+        return len(added)
+
+    def _add_plugin(self, plugin: PluginBase) -> list[str] | None:
+        """
+        Store a plugin and append it to its hook lists without sorting.
+
+        Returns:
+            Names of the hooks the plugin was added to, or None if a plugin
+            with the same name is already registered
+        """
         meta = plugin.metadata
 
         if meta.name in self._plugins:
             logger.warning(f"Plugin already registered: {meta.name}")
-            return False
+            return None
 
         # Store plugin
         self._plugins[meta.name] = plugin
@@ -110,19 +166,26 @@ class PluginRegistry:
         self._auto_configure_plugin(plugin)
 
         # Register hooks
+        hooks = []
         for hook in meta.hooks:
             if hook in self._hooks:
                 self._hooks[hook].append(plugin)
-                # Sort by priority (lower = higher priority)
-                self._hooks[hook].sort(key=lambda p: p.metadata.priority)
+                hooks.append(hook)
             else:
                 logger.warning(f"Unknown hook '{hook}' in plugin {meta.name}")
+        return hooks
 
-        # Call lifecycle hook
+    def _sort_hooks(self, hooks: Iterable[str]) -> None:
+        """Sort the given hook lists by priority (lower = higher priority)."""
+        for hook in hooks:
+            self._hooks[hook].sort(key=lambda p: p.metadata.priority)
+
+    def _finish_registration(self, plugin: PluginBase) -> None:
+        """Run the load lifecycle hook for a newly registered plugin."""
         plugin.on_load({"registry": self})
 
+        meta = plugin.metadata
         logger.info(f"Registered plugin: {meta.name} v{meta.version}")
-        return True
 
     def _auto_configure_plugin(self, plugin: PluginBase) -> None:
         """
@@ -190,6 +253,7 @@ class PluginRegistry:
         # Remove from hooks
         for hook_list in self._hooks.values():
             hook_list[:] = [p for p in hook_list if p.metadata.name != name]
+        self._invalidate_hooks()
 
         # Remove from plugins
         del self._plugins[name]
@@ -201,17 +265,55 @@ class PluginRegistry:
         """Get a plugin by name."""
         return self._plugins.get(name)
 
-    def get_hooks(self, hook_name: str) -> list[PluginBase]:
+    def get_hooks(self, hook_name: str) -> tuple[PluginBase, ...]:
         """
-        Get all plugins registered for a specific hook.
+        Get all enabled plugins registered for a specific hook.
 
         Args:
             hook_name: Name of the hook
 
         Returns:
-            List of plugins sorted by priority
+            Tuple of plugins sorted by priority; the cached tuple itself is
+            returned while every plugin registered for the hook is enabled
+        """
+        plugins = self._hook_plugins.get(hook_name)
+        if plugins is None:
+            plugins = tuple(plugin for plugin, _ in self._resolve_hook(hook_name))
+            self._hook_plugins[hook_name] = plugins
+        if all(plugin.metadata.enabled for plugin in plugins):
+            return plugins
+        return tuple(plugin for plugin in plugins if plugin.metadata.enabled)
+
+    def _invalidate_hooks(self) -> None:
+        """Drop cached hook dispatch data after a registry change."""
+        self._hook_index.clear()
+        self._hook_plugins.clear()
+        self._chain_reducers.clear()
+
+    def _resolve_hook(
+        self, hook_name: str
+    ) -> list[tuple[PluginBase, Callable[..., Any] | None]]:
         """
-        return [p for p in self._hooks.get(hook_name, []) if p.metadata.enabled]
+        Get plugins for a hook paired with their bound class hook method.
+
+        Results are cached per hook name so dispatch does not repeat the
+        class attribute lookup for every plugin on every call. The method is
+        None when the plugin class did not define the hook; enabled state and
+        instance-level hooks are checked at dispatch by _live_hook().
+        """
+        entries = self._hook_index.get(hook_name)
+        if entries is None:
+            entries = [
+                (
+                    plugin,
+                    getattr(plugin, hook_name)
+                    if hook_name in type(plugin)._hook_methods
+                    else None,
+                )
+                for plugin in self._hooks.get(hook_name, [])
+            ]
+            self._hook_index[hook_name] = entries
+        return entries
 
     def list_plugins(self) -> list[PluginMetadata]:
         """List all registered plugins."""
@@ -222,6 +324,7 @@ class PluginRegistry:
         plugin = self._plugins.get(name)
         if plugin:
             plugin.metadata.enabled = True
+            self._invalidate_hooks()
             plugin.on_enable()
             logger.info(f"Enabled plugin: {name}")
             return True
@@ -232,6 +335,7 @@ class PluginRegistry:
         plugin = self._plugins.get(name)
         if plugin:
             plugin.metadata.enabled = False
+            self._invalidate_hooks()
             plugin.on_disable()
             logger.info(f"Disabled plugin: {name}")
             return True
@@ -242,6 +346,7 @@ class PluginRegistry:
         plugin = self._plugins.get(name)
         if plugin:
             plugin.configure(config)
+            self._invalidate_hooks()
             logger.info(f"Configured plugin: {name}")
             return True
         return False
@@ -304,6 +409,18 @@ class PluginRegistry:
 
         self._loaded_modules[module_name] = module
 
+        return self._load_plugin_module(module)
+
+    def _load_plugin_module(self, module: ModuleType) -> int:
+        """
+        Register plugins from an already executed module.
+
+        Args:
+            module: Module whose plugin classes should be instantiated
+
+        Returns:
+            Number of plugins loaded from module
+        """
         # Find and register plugin classes
         count = 0
         for attr_name in dir(module):
@@ -419,12 +536,12 @@ class PluginRegistry:
         """
         results = []
 
-        for plugin in self.get_hooks(hook_name):
+        for plugin, method in self._resolve_hook(hook_name):
+            hook = _live_hook(plugin, hook_name, method)
+            if hook is None:
+                continue
             try:
-                method = getattr(plugin, hook_name, None)
-                if method and callable(method):
-                    result = method(*args, **kwargs)
-                    results.append(result)
+                results.append(hook(*args, **kwargs))
             except Exception as e:
                 logger.error(
                     f"Error executing hook {hook_name} in {plugin.metadata.name}: {e}"
@@ -447,19 +564,37 @@ class PluginRegistry:
         Returns:
             Final value after all plugins have processed
         """
-        value = initial_value
+        reducer = self._chain_reducers.get(hook_name)
+        if reducer is None:
+            reducer = self._build_chain_reducer(hook_name)
+            self._chain_reducers[hook_name] = reducer
+        return reducer(initial_value, *args, **kwargs)
 
-        for plugin in self.get_hooks(hook_name):
-            try:
-                method = getattr(plugin, hook_name, None)
-                if method and callable(method):
-                    value = method(value, *args, **kwargs)
-            except Exception as e:
-                logger.error(
-                    f"Error in hook chain {hook_name} at {plugin.metadata.name}: {e}"
-                )
+    def _build_chain_reducer(self, hook_name: str) -> Callable[..., Any]:
+        """
+        Build a closure that folds a value through a hook's plugin chain.
+
+        The ordered (plugin, method) pairs are captured once, so each chain
+        execution is a plain loop over local state until the registry
+        changes again.
+        """
+        steps = tuple(self._resolve_hook(hook_name))
+
+        def reducer(value: Any, *args: Any, **kwargs: Any) -> Any:
+            for plugin, method in steps:
+                hook = _live_hook(plugin, hook_name, method)
+                if hook is None:
+                    continue
+                try:
+                    value = hook(value, *args, **kwargs)
+                except Exception as e:
+                    logger.error(
+                        f"Error in hook chain {hook_name} at "
+                        f"{plugin.metadata.name}: {e}"
+                    )
+            return value
 
-        return value
+        return reducer
 
     def clear(self) -> None:
         """Clear all registered plugins."""
@@ -484,15 +619,34 @@ class PluginRegistry:
         }
 
 
-# Global registry instance
-_registry: PluginRegistry | None = None
+def _live_hook(
+    plugin: PluginBase, hook_name: str, method: Callable[..., Any] | None
+) -> Callable[..., Any] | None:
+    """
+    Get the hook callable to dispatch to right now, or None to skip.
+
+    The enabled flag and the plugin's instance attributes are read on every
+    call, so direct metadata changes and hooks assigned after the dispatch
+    cache was built take effect immediately. When the cached class method is
+    None the hook is looked up again in case it was added to the class later.
+    """
+    if not plugin.metadata.enabled:
+        return None
+    instance_attrs = getattr(plugin, "__dict__", None)
+    if instance_attrs and hook_name in instance_attrs:
+        method = instance_attrs[hook_name]
+    elif method is None:
+        method = getattr(plugin, hook_name, None)
+    return method if callable(method) else None
+
+
+# Global registry instance, created at import so accessors skip the singleton
+# guard in PluginRegistry.__new__
+_registry = PluginRegistry()
 
 
 def get_plugin_registry() -> PluginRegistry:
     """Get the global plugin registry singleton."""
-    global _registry
-    if _registry is None:
-        _registry = PluginRegistry()
     return _registry
 
 
@@ -501,6 +655,6 @@ def register_plugin(plugin: PluginBase) -> bool:
     return get_plugin_registry().register(plugin)
 
 
-def get_hooks(hook_name: str) -> list[PluginBase]:
+def get_hooks(hook_name: str) -> tuple[PluginBase, ...]:
     """Convenience function to get plugins for a hook."""
     return get_plugin_registry().get_hooks(hook_name)
@@ -18,7 +18,6 @@ from typing import Any
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
@@ -152,6 +151,9 @@ def run_async(coro: Any) -> Any:
 
 def display_content(content: str, format: str = "markdown") -> None:
     """Display content with appropriate formatting."""
+    # rich.markdown pulls in markdown-it; only pay for it when rendering
+    from rich.markdown import Markdown
+
     if format == "markdown":
         console.print(Markdown(content))
     elif format == "syntax":
@@ -679,20 +681,7 @@ Experts: 24 Level 5
 # ============================================================================
 
 
-@app.command()
-def interactive() -> None:
-    """Start interactive REPL mode."""
-    console.print(
-        Panel(
-            "Interactive Mode - Type 'help' for commands, 'exit' to quit",
-            title="AI Collaboration KB",
-            border_style="green",
-        )
-    )
-
-    loader = get_loader()
-
-    commands_help = """
+_INTERACTIVE_HELP = """
 Available commands:
   get [layer]           - Get knowledge (0=core, 1=guidelines, 2=frameworks)
   search <query>        - Search knowledge base
@@ -705,75 +694,95 @@ Available commands:
   exit                  - Exit interactive mode
     """
 
-    while True:
-        try:
-            cmd = console.input("[bold blue]sage>[/bold blue] ").strip()
 
-            if not cmd:
-                continue
+def _dispatch_interactive_command(cmd: str, loader: KnowledgeLoader) -> bool:
+    """Run one REPL line. Returns False when the session should end."""
+    if not cmd:
+        return True
 
-            parts = cmd.split(maxsplit=1)
-            action = parts[0].lower()
-            args = parts[1] if len(parts) > 1 else ""
+    parts = cmd.split(maxsplit=1)
+    action = parts[0].lower()
+    args = parts[1] if len(parts) > 1 else ""
 
-            if action == "exit" or action == "quit":
-                console.print("[dim]Goodbye![/dim]")
-                break
+    if action == "exit" or action == "quit":
+        console.print("[dim]Goodbye![/dim]")
+        return False
 
-            elif action == "help":
-                console.print(commands_help)
-
-            elif action == "get":
-                layer = int(args) if args.isdigit() else 0
-                result = run_async(
-                    loader.load(
-                        layer={
-                            0: Layer.L1_CORE,
-                            1: Layer.L2_GUIDELINES,
-                            2: Layer.L3_FRAMEWORKS,
-                        }.get(layer, Layer.L1_CORE)
-                    )
-                )
-                display_result(result)
+    elif action == "help":
+        console.print(_INTERACTIVE_HELP)
 
-            elif action == "search":
-                if not args:
-                    console.print("[yellow]Usage: search <query>[/yellow]")
-                else:
-                    results = run_async(loader.search(args, max_results=5))
-                    for r in results:
-                        console.print(f"[cyan]{r['score']}[/cyan] {r['path']}")
-
-            elif action == "guidelines":
-                section = args or "overview"
-                result = run_async(loader.load_guidelines(section))
-                display_result(result)
-
-            elif action == "framework":
-                if not args:
-                    console.print("[yellow]Usage: framework <name>[/yellow]")
-                else:
-                    result = run_async(loader.load_framework(args))
-                    display_result(result)
+    elif action == "get":
+        layer = int(args) if args.isdigit() else 0
+        result = run_async(
+            loader.load(
+                layer={
+                    0: Layer.L1_CORE,
+                    1: Layer.L2_GUIDELINES,
+                    2: Layer.L3_FRAMEWORKS,
+                }.get(layer, Layer.L1_CORE)
+            )
+        )
+        display_result(result)
 
-            elif action == "info":
-                info()
+    elif action == "search":
+        if not args:
+            console.print("[yellow]Usage: search <query>[/yellow]")
+        else:
+            results = run_async(loader.search(args, max_results=5))
+            for r in results:
+                console.print(f"[cyan]{r['score']}[/cyan] {r['path']}")
+
+    elif action == "guidelines":
+        section = args or "overview"
+        result = run_async(loader.load_guidelines(section))
+        display_result(result)
+
+    elif action == "framework":
+        if not args:
+            console.print("[yellow]Usage: framework <name>[/yellow]")
+        else:
+            result = run_async(loader.load_framework(args))
+            display_result(result)
 
-            elif action == "cache":
-                stats = loader.get_cache_stats()
-                console.print(
-                    f"Cached: {stats['cached_files']} files, {stats['total_size']:,} bytes"
-                )
+    elif action == "info":
+        info()
 
-            elif action == "clear":
-                loader.clear_cache()
-                console.print("[green]Cache cleared[/green]")
+    elif action == "cache":
+        stats = loader.get_cache_stats()
+        console.print(
+            f"Cached: {stats['cached_files']} files, {stats['total_size']:,} bytes"
+        )
 
-            else:
-                console.print(
-                    f"[yellow]Unknown command: {action}. Type 'help' for commands.[/yellow]"
-                )
+    elif action == "clear":
+        loader.clear_cache()
+        console.print("[green]Cache cleared[/green]")
 
+    else:
+        console.print(
+            f"[yellow]Unknown command: {action}. Type 'help' for commands.[/yellow]"
+        )
+
+    return True
+
+
+@app.command()
+def interactive() -> None:
+    """Start interactive REPL mode."""
+    console.print(
+        Panel(
+            "Interactive Mode - Type 'help' for commands, 'exit' to quit",
+            title="AI Collaboration KB",
+            border_style="green",
+        )
+    )
+
+    loader = get_loader()
+
+    while True:
+        try:
+            cmd = console.input("[bold blue]sage>[/bold blue] ").strip()
+            if not _dispatch_interactive_command(cmd, loader):
+                break
         except KeyboardInterrupt:
             console.print("\n[dim]Use 'exit' to quit[/dim]")
         except Exception as e:
@@ -18,7 +18,6 @@ Author: SAGE AI Collab Team
 Version: 0.1.0
 """
 
-import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -210,19 +209,6 @@ def mock_search_results() -> list[dict[str, Any]]:
     ]
 
 
-# ============================================================================
-# Async Fixtures
-# ============================================================================
-
-
-@pytest.fixture
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 # ============================================================================
 # Marker Registration
 # ============================================================================
@@ -237,3 +223,7 @@ def pytest_configure(config):
         "markers", "benchmark: mark test as a performance benchmark"
     )
     config.addinivalue_line("markers", "slow: mark test as slow running")
+    # Registered here too so the marker is known when pytest-xdist is absent
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests in the group on one xdist worker"
+    )
@@ -0,0 +1,140 @@
+"""
+Tests for tools/check_docs.py
+
+Covers the directory walk, raw-bytes H2 parsing and the process-pool path
+of check_directory.
+
+Run with: pytest tests/tools/test_check_docs.py -v
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from tools import check_docs
+from tools.check_docs import (
+    SKIP_DIRS,
+    _find_markdown,
+    _h2_headings,
+    check_directory,
+    check_document,
+)
+
+NOT_NUMBERED = "H2 sections not numbered (e.g., '## 1. Section')"
+
+
+def _write_docs(root: Path, count: int) -> None:
+    """Write count small documents with mixed line endings under root."""
+    for i in range(count):
+        newline = "\r\n" if i % 2 else "\n"
+        lines = ["---", f"title: doc {i}", "---", ""]
+        lines += [f"## Part {n}" for n in range(i % 5)]
+        (root / f"doc{i:02}.md").write_bytes(newline.join(lines).encode())
+
+
+class TestFindMarkdown:
+    """Tests for the scandir walk behind check_directory."""
+
+    def test_skip_dirs_pruned(self, tmp_path: Path) -> None:
+        """Verify SKIP_DIRS are not descended into but other dirs are."""
+        for name in [*SKIP_DIRS, ".knowledge", "docs"]:
+            (tmp_path / name / "sub").mkdir(parents=True)
+            (tmp_path / name / "sub" / "a.md").write_text("# a\n")
+        (tmp_path / "top.md").write_text("# top\n")
+        (tmp_path / "notes.txt").write_text("x\n")
+
+        found = {
+            p.relative_to(tmp_path).as_posix() for p in _find_markdown(tmp_path, True)
+        }
+
+        assert found == {"top.md", ".knowledge/sub/a.md", "docs/sub/a.md"}
+
+    def test_non_recursive(self, tmp_path: Path) -> None:
+        """Verify recursive=False only returns top-level files."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "a.md").write_text("# a\n")
+        (tmp_path / "top.md").write_text("# top\n")
+
+        assert _find_markdown(tmp_path, False) == [tmp_path / "top.md"]
+
+
+class TestCheckDocument:
+    """Tests for check_document on raw bytes."""
+
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n"], ids=["lf", "crlf"])
+    def test_h2_headings(self, newline: bytes) -> None:
+        """Verify only line-leading '## ' headings are collected."""
+        raw = newline.join(
+            [b"## One", b"text ## not a heading", b"### Three", b"## Two"]
+        )
+
+        headings = [h.rstrip(b"\r") for h in _h2_headings(raw)]
+
+        assert headings == [b"One", b"Two"]
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+    def test_unnumbered_sections_reported(self, tmp_path: Path, newline: str) -> None:
+        """Verify unnumbered H2s are flagged and meta sections are ignored."""
+        doc = tmp_path / "doc.md"
+        lines = ["---", "last_updated: 2025-01-01", "tokens: 10", "---"]
+        lines += ["## Intro", "## Usage", "## Related", "## References"]
+        doc.write_bytes(newline.join(lines).encode())
+        messages = [i.message for i in check_document(doc).issues]
+        assert NOT_NUMBERED not in messages
+
+        doc.write_bytes(newline.join([*lines, "## Details"]).encode())
+        result = check_document(doc)
+
+        assert result.has_frontmatter
+        assert NOT_NUMBERED in [i.message for i in result.issues]
+
+    def test_large_document_missing_toc(self, tmp_path: Path) -> None:
+        """Verify a long document with several H2s and no TOC is warned."""
+        doc = tmp_path / "doc.md"
+        body = [f"## {n}. Part\r\n" + "line\r\n" * 20 for n in range(1, 5)]
+        doc.write_bytes("".join(body).encode())
+
+        result = check_document(doc)
+
+        assert result.status == "WARN"
+        assert any("missing TOC" in i.message for i in result.issues)
+
+
+class TestCheckDirectory:
+    """Tests for the serial and process-pool paths of check_directory."""
+
+    def test_parallel_matches_serial(self, tmp_path: Path, monkeypatch) -> None:
+        """Verify the process pool returns the same results as the serial path."""
+        _write_docs(tmp_path, 6)
+        serial = check_directory(tmp_path)
+
+        pools = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                pools.append(self)
+                # spawn: forking the multi-threaded test process can deadlock
+                kwargs.setdefault("mp_context", multiprocessing.get_context("spawn"))
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(check_docs, "PARALLEL_MIN_FILES", 2)
+        monkeypatch.setattr(check_docs, "ProcessPoolExecutor", RecordingPool)
+        parallel = check_directory(tmp_path)
+
+        assert len(pools) == 1
+        assert parallel == serial
+        assert [r.status for r in parallel] == [r.status for r in serial]
+
+    def test_below_threshold_stays_serial(self, tmp_path: Path, monkeypatch) -> None:
+        """Verify small directories never start a process pool."""
+        _write_docs(tmp_path, 3)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(check_docs, "PARALLEL_MIN_FILES", 4)
+        monkeypatch.setattr(check_docs, "ProcessPoolExecutor", fail)
+
+        assert len(check_directory(tmp_path)) == 3
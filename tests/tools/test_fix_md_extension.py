@@ -0,0 +1,65 @@
+"""
+Tests for tools/fix_md_extension.py
+
+Run with: pytest tests/tools/test_fix_md_extension.py -v
+"""
+
+from pathlib import Path
+
+import pytest
+
+from tools.fix_md_extension import (
+    _SKIP_DIRS,
+    _find_md_files,
+    _fix_file,
+    fix_md_extensions,
+)
+
+
+class TestFixFile:
+    """Tests for the per-file .MD -> .md rewrite."""
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"], ids=["lf", "crlf"])
+    def test_line_endings_preserved(self, tmp_path: Path, newline: str) -> None:
+        """Verify rewritten files keep their original line endings."""
+        doc = tmp_path / "doc.md"
+        doc.write_bytes(f"See README.MD{newline}and GUIDE.MD){newline}".encode())
+
+        assert _fix_file(str(doc)) == (2, None)
+        assert (
+            doc.read_bytes() == f"See README.md{newline}and GUIDE.md){newline}".encode()
+        )
+
+    def test_file_without_md_untouched(self, tmp_path: Path) -> None:
+        """Verify files with no .MD reference are not rewritten."""
+        doc = tmp_path / "doc.md"
+        doc.write_bytes(b"plain.md\r\n")
+        mtime = doc.stat().st_mtime_ns
+
+        assert _fix_file(str(doc)) == (0, None)
+        assert doc.stat().st_mtime_ns == mtime
+
+
+class TestFixMdExtensions:
+    """Tests for the directory walk and summary output."""
+
+    def test_skip_dirs_pruned(self, tmp_path: Path, monkeypatch, capsys) -> None:
+        """Verify files under _SKIP_DIRS are neither listed nor rewritten."""
+        for name in [*_SKIP_DIRS, ".knowledge", "docs"]:
+            (tmp_path / name / "sub").mkdir(parents=True)
+            (tmp_path / name / "sub" / "a.md").write_text("See A.MD\n")
+        (tmp_path / "top.md").write_text("See A.MD and B.MD\n")
+        (tmp_path / "notes.txt").write_text("See A.MD\n")
+        monkeypatch.chdir(tmp_path)
+
+        found = {Path(p).relative_to(".").as_posix() for p in _find_md_files()}
+        fix_md_extensions()
+
+        assert found == {"top.md", ".knowledge/sub/a.md", "docs/sub/a.md"}
+        for name in _SKIP_DIRS:
+            assert (tmp_path / name / "sub" / "a.md").read_text() == "See A.MD\n"
+        assert (tmp_path / "docs" / "sub" / "a.md").read_text() == "See A.md\n"
+        assert (tmp_path / "notes.txt").read_text() == "See A.MD\n"
+        out = capsys.readouterr().out
+        assert "Updated 3 files" in out
+        assert "Total replacements: 4" in out
@@ -0,0 +1,124 @@
+"""
+Tests for tools/remove_frontmatter.py
+
+Run with: pytest tests/tools/test_remove_frontmatter.py -v
+"""
+
+from pathlib import Path
+
+import pytest
+
+from tools.remove_frontmatter import (
+    _frontmatter_end,
+    _strip_frontmatter,
+    remove_frontmatter,
+)
+
+BOM = b"\xef\xbb\xbf"
+
+
+class TestFrontmatterEnd:
+    """Tests for locating the closing frontmatter line."""
+
+    @pytest.mark.parametrize(
+        ("text", "body"),
+        [
+            ("---\na: 1\n---\nbody", "body"),
+            ("---\r\na: 1\r\n---\r\nbody", "body"),
+            ("--- \na: 1\n  ---  \nbody", "body"),
+            ("---\na: ---x\n---", ""),
+            ("---\na: 1\n", None),
+            ("---", None),
+            ("# Title\n---\n", None),
+        ],
+        ids=[
+            "lf",
+            "crlf",
+            "padded",
+            "dashes-in-value",
+            "unclosed",
+            "one-line",
+            "no-open",
+        ],
+    )
+    def test_body_offset(self, text: str, body: str | None) -> None:
+        """Verify the offset lands just past the closing '---' line."""
+        end = _frontmatter_end(text)
+        assert (None if end is None else text[end:]) == body
+
+
+class TestStripFrontmatter:
+    """Tests for the per-file frontmatter removal."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (b"---\ntitle: x\n---\n\n# Body\n", b"# Body\n"),
+            (BOM + b"---\ntitle: x\n---\n# Body\n", b"# Body\n"),
+            (BOM * 3 + b"---\ntitle: x\n---\n# Body\n", b"# Body\n"),
+            (b"---\r\ntitle: x\r\n---\r\n\r\n# Body\r\n", b"# Body\r\n"),
+            (b"  \n\n---\ntitle: x\n---\n# Body\n", b"# Body\n"),
+            ("　---\ntitle: x\n---\n# Body\n".encode(), b"# Body\n"),
+        ],
+        ids=["lf", "bom", "repeated-bom", "crlf", "leading-blank", "non-ascii-space"],
+    )
+    def test_frontmatter_removed(
+        self, tmp_path: Path, raw: bytes, expected: bytes
+    ) -> None:
+        """Verify frontmatter and any BOMs are stripped from the file."""
+        doc = tmp_path / "doc.md"
+        doc.write_bytes(raw)
+
+        assert _strip_frontmatter(doc) == (True, None)
+        assert doc.read_bytes() == expected
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b"# Title\n---\na: 1\n---\n",
+            BOM + b"# Title\n",
+            b"---\ntitle: unclosed\n",
+            b"",
+        ],
+        ids=["heading-first", "bom-heading", "unclosed", "empty"],
+    )
+    def test_file_without_frontmatter_untouched(
+        self, tmp_path: Path, raw: bytes
+    ) -> None:
+        """Verify files that don't open with frontmatter are left as they are."""
+        doc = tmp_path / "doc.md"
+        doc.write_bytes(raw)
+
+        assert _strip_frontmatter(doc) == (False, None)
+        assert doc.read_bytes() == raw
+
+    def test_decode_error_returned(self, tmp_path: Path) -> None:
+        """Verify undecodable files report the error instead of raising."""
+        doc = tmp_path / "doc.md"
+        doc.write_bytes(b"---\n\xff\n---\n")
+
+        changed, error = _strip_frontmatter(doc)
+
+        assert changed is False
+        assert isinstance(error, UnicodeDecodeError)
+
+
+class TestRemoveFrontmatter:
+    """Tests for the .knowledge walk."""
+
+    def test_git_dirs_skipped(self, tmp_path: Path, monkeypatch, capsys) -> None:
+        """Verify files under .git are skipped and hidden dirs are included."""
+        raw = b"---\ntitle: x\n---\n# Body\n"
+        for rel in ["a.md", ".hidden/b.md", "sub/.git/c.md", "sub/d.md"]:
+            path = tmp_path / ".knowledge" / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(raw)
+        monkeypatch.chdir(tmp_path)
+
+        remove_frontmatter()
+
+        knowledge = tmp_path / ".knowledge"
+        assert (knowledge / "sub" / ".git" / "c.md").read_bytes() == raw
+        for rel in ["a.md", ".hidden/b.md", "sub/d.md"]:
+            assert (knowledge / rel).read_bytes() == b"# Body\n"
+        assert "Total updated: 3 files" in capsys.readouterr().out
@@ -0,0 +1,29 @@
+"""
+Service Test Configuration - Shared fixtures for service tests.
+
+Author: SAGE AI Collab Team
+Version: 0.1.0
+"""
+
+from types import ModuleType
+
+import pytest
+
+from sage.core.loader import KnowledgeLoader
+
+
+@pytest.fixture(scope="session")
+def mcp_mod() -> ModuleType:
+    """The sage.services.mcp_server module, imported once per session."""
+    import sage.services.mcp_server as mcp_server
+
+    return mcp_server
+
+
+@pytest.fixture(scope="session")
+async def warm_mcp_loader(mcp_mod: ModuleType) -> KnowledgeLoader:
+    """Build the shared loader and load the core layer once per session."""
+    mcp_mod._load_config()
+    loader = mcp_mod.get_loader()
+    await loader.load_core()
+    return loader
@@ -0,0 +1,31 @@
+"""
+Unit tests for MCP Server without the optional mcp dependency.
+
+Tests cover:
+- create_app and run_server failing fast when MCP is not installed
+
+Author: SAGE AI Collab Team
+Version: 0.1.0
+"""
+
+import pytest
+
+from sage.services.mcp_server import MCP_AVAILABLE, create_app, run_server
+
+pytestmark = pytest.mark.skipif(
+    MCP_AVAILABLE, reason="MCP is available, cannot test unavailable case"
+)
+
+
+class TestWithoutMCP:
+    """Tests for the MCP-unavailable code paths."""
+
+    def test_create_app_raises(self):
+        """Test create_app raises ImportError when MCP unavailable."""
+        with pytest.raises(ImportError):
+            create_app()
+
+    def test_run_server_raises(self):
+        """Test run_server raises ImportError when MCP unavailable."""
+        with pytest.raises(ImportError):
+            run_server()
@@ -22,18 +22,7 @@ Author: SAGE AI Collab Team
 Version: 0.1.0
 """
 
-from .timeout_manager import (
-    EMBEDDED_CORE,
-    CircuitBreaker,
-    CircuitBreakerConfig,
-    CircuitState,
-    TimeoutConfig,
-    TimeoutLevel,
-    TimeoutManager,
-    TimeoutResult,
-    get_default_timeout_manager,
-    get_timeout_manager,
-)
+from typing import Any
 
 __all__ = [
     # Timeout Management
@@ -50,3 +39,21 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# Re-exports resolve on first access (PEP 562), so running a single script such
+# as `python -m tools.check_docs` doesn't import timeout_manager.
+_LAZY_EXPORTS = frozenset(__all__)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        from . import timeout_manager
+
+        value = getattr(timeout_manager, name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS)
@@ -15,13 +15,38 @@ Usage:
     python scripts/check_docs.py .knowledge/
 """
 
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional
 
+# Minimum number of files before check_directory fans out to worker processes
+PARALLEL_MIN_FILES = 16
 
-@dataclass
+# H2 heading lines; group 1 is the heading text
+_H2_RE = re.compile(rb"^## (.*)", re.MULTILINE)
+
+# Directories check_directory never descends into
+SKIP_DIRS = frozenset({".git", "__pycache__", "node_modules"})
+
+# Pre-formatted output fragments for print_results
+STATUS_LABELS = {
+    "FAIL": "\033[91m[FAIL]\033[0m",  # Red
+    "WARN": "\033[93m[WARN]\033[0m",  # Yellow
+    "PASS": "\033[92m[PASS]\033[0m",  # Green
+}
+ISSUE_PREFIXES = {
+    "error": "  ❌",
+    "warning": "  ⚠️",
+    "info": "  ℹ️",
+}
+
+
+@dataclass(slots=True)
 class Issue:
     """Documentation issue."""
     severity: str  # error, warning, info
@@ -40,8 +65,9 @@ class CheckResult:
     has_numbered_sections: bool
     issues: List[Issue] = field(default_factory=list)
     
-    @property
+    @cached_property
     def status(self) -> str:
+        # Cached: issues are final once check_document returns
         errors = sum(1 for i in self.issues if i.severity == "error")
         warnings = sum(1 for i in self.issues if i.severity == "warning")
         if errors > 0:
@@ -51,20 +77,26 @@ class CheckResult:
         return "PASS"
 
 
+def _h2_headings(raw: bytes) -> List[bytes]:
+    """Return the text after '## ' for every H2 heading line."""
+    return _H2_RE.findall(raw)
+
+
 def check_document(path: Path) -> CheckResult:
     """Check a single document against standards."""
-    content = path.read_text(encoding="utf-8")
-    lines = content.split("\n")
-    line_count = len(lines)
+    # Work on raw bytes throughout; nothing here needs decoded text
+    raw = path.read_bytes()
+    line_count = raw.count(b"\n") + 1
     
     result = CheckResult(
         path=path,
         lines=line_count,
-        has_frontmatter=content.startswith("---"),
-        has_toc="## Table of Contents" in content or "## TOC" in content,
-        has_footer="*Part of SAGE Knowledge Base*" in content or "*SAGE Knowledge Base" in content,
-        has_numbered_sections="## 1." in content or "## 1 " in content,
+        has_frontmatter=raw.startswith(b"---"),
+        has_toc=b"## Table of Contents" in raw or b"## TOC" in raw,
+        has_footer=b"*Part of SAGE Knowledge Base*" in raw or b"*SAGE Knowledge Base" in raw,
+        has_numbered_sections=b"## 1." in raw or b"## 1 " in raw,
     )
+    h2_headings = None  # collected on first use, shared by the TOC and numbering checks
     
     # Check line count
     if line_count > 600:
@@ -86,15 +118,15 @@ def check_document(path: Path) -> CheckResult:
         ))
     else:
         # Check frontmatter fields
-        frontmatter_end = content.find("---", 3)
+        frontmatter_end = raw.find(b"---", 3)
         if frontmatter_end > 0:
-            frontmatter = content[3:frontmatter_end]
-            if "last_updated" not in frontmatter and "date" not in frontmatter:
+            frontmatter = raw[3:frontmatter_end]
+            if b"last_updated" not in frontmatter and b"date" not in frontmatter:
                 result.issues.append(Issue(
                     severity="info",
                     message="Frontmatter missing last_updated field"
                 ))
-            if "tokens" not in frontmatter:
+            if b"tokens" not in frontmatter:
                 result.issues.append(Issue(
                     severity="info",
                     message="Frontmatter missing tokens estimate"
@@ -102,8 +134,9 @@ def check_document(path: Path) -> CheckResult:
     
     # Check TOC for large documents
     if line_count > 60 and not result.has_toc:
+        h2_headings = _h2_headings(raw)
         # Count H2 headings
-        h2_count = sum(1 for line in lines if line.startswith("## "))
+        h2_count = len(h2_headings)
         if h2_count > 3:
             result.issues.append(Issue(
                 severity="warning",
@@ -118,11 +151,12 @@ def check_document(path: Path) -> CheckResult:
         ))
     
     # Check section numbering
-    h2_lines = [(i, line) for i, line in enumerate(lines, 1) if line.startswith("## ")]
-    if h2_lines and not result.has_numbered_sections:
+    if not result.has_numbered_sections:
+        if h2_headings is None:
+            h2_headings = _h2_headings(raw)
         # Skip if it's just TOC and Related sections
-        non_meta_h2 = [h for h in h2_lines if not any(
-            x in h[1] for x in ["Table of Contents", "TOC", "Related", "References"]
+        non_meta_h2 = [h for h in h2_headings if not any(
+            x in h for x in [b"Table of Contents", b"TOC", b"Related", b"References"]
         )]
         if len(non_meta_h2) > 2:
             result.issues.append(Issue(
@@ -133,18 +167,31 @@ def check_document(path: Path) -> CheckResult:
     return result
 
 
+def _find_markdown(path: Path, recursive: bool) -> List[Path]:
+    """Collect .md files under path, pruning SKIP_DIRS as they are reached."""
+    md_files = []
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    md_files.append(Path(entry.path))
+    return md_files
+
+
 def check_directory(path: Path, recursive: bool = True) -> List[CheckResult]:
     """Check all markdown files in a directory."""
-    results = []
-    pattern = "**/*.md" if recursive else "*.md"
-    
-    for md_file in path.glob(pattern):
-        # Skip certain directories
-        if any(skip in str(md_file) for skip in [".git", "__pycache__", "node_modules"]):
-            continue
-        results.append(check_document(md_file))
+    md_files = _find_markdown(path, recursive)
     
-    return results
+    # Checks are CPU-bound and independent; below the threshold the process
+    # pool's startup cost outweighs the gain
+    if len(md_files) < PARALLEL_MIN_FILES:
+        return [check_document(md_file) for md_file in md_files]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(check_document, md_files, chunksize=32))
 
 
 def print_results(results: List[CheckResult], verbose: bool = False):
@@ -153,73 +200,78 @@ def print_results(results: List[CheckResult], verbose: bool = False):
     status_order = {"FAIL": 0, "WARN": 1, "PASS": 2}
     results.sort(key=lambda r: (status_order.get(r.status, 3), -r.lines))
     
-    # Summary counts
+    # Summary counts and recommendation buckets in a single pass
     total = len(results)
-    passed = sum(1 for r in results if r.status == "PASS")
-    warned = sum(1 for r in results if r.status == "WARN")
-    failed = sum(1 for r in results if r.status == "FAIL")
+    counts = {"PASS": 0, "WARN": 0, "FAIL": 0}
+    over_limit = []
+    missing_frontmatter = []
+    missing_toc = []
+    for r in results:
+        counts[r.status] += 1
+        if r.lines > 300:
+            over_limit.append(r)
+        if not r.has_frontmatter:
+            missing_frontmatter.append(r)
+        if not r.has_toc and r.lines > 60:
+            missing_toc.append(r)
+    passed, warned, failed = counts["PASS"], counts["WARN"], counts["FAIL"]
+    
+    # Buffer the report and emit it with a single write
+    out = []
     
-    print("\n" + "=" * 70)
-    print("SAGE Documentation Standards Check")
-    print("=" * 70)
+    out.append("\n" + "=" * 70)
+    out.append("SAGE Documentation Standards Check")
+    out.append("=" * 70)
     
     # Print issues
     for result in results:
         if result.status == "PASS" and not verbose:
             continue
             
-        status_color = {
-            "FAIL": "\033[91m",  # Red
-            "WARN": "\033[93m",  # Yellow
-            "PASS": "\033[92m",  # Green
-        }.get(result.status, "")
-        reset = "\033[0m"
-        
-        print(f"\n{status_color}[{result.status}]{reset} {result.path} ({result.lines} lines)")
+        out.append(f"\n{STATUS_LABELS[result.status]} {result.path} ({result.lines} lines)")
         
         for issue in result.issues:
-            prefix = {
-                "error": "  ❌",
-                "warning": "  ⚠️",
-                "info": "  ℹ️",
-            }.get(issue.severity, "  •")
-            print(f"{prefix} {issue.message}")
+            prefix = ISSUE_PREFIXES.get(issue.severity, "  •")
+            out.append(f"{prefix} {issue.message}")
     
     # Summary
-    print("\n" + "-" * 70)
-    print(f"Summary: {total} files checked")
-    print(f"  ✅ Passed: {passed}")
-    print(f"  ⚠️  Warnings: {warned}")
-    print(f"  ❌ Failed: {failed}")
+    out.append("\n" + "-" * 70)
+    out.append(f"Summary: {total} files checked")
+    out.append(f"  ✅ Passed: {passed}")
+    out.append(f"  ⚠️  Warnings: {warned}")
+    out.append(f"  ❌ Failed: {failed}")
     
     # Recommendations
     if failed > 0 or warned > 0:
-        print("\nRecommendations:")
+        out.append("\nRecommendations:")
         
-        over_limit = [r for r in results if r.lines > 300]
         if over_limit:
-            print(f"  • {len(over_limit)} documents exceed 300 lines - consider splitting")
+            out.append(f"  • {len(over_limit)} documents exceed 300 lines - consider splitting")
             for r in sorted(over_limit, key=lambda x: -x.lines)[:5]:
-                print(f"    - {r.path.name}: {r.lines} lines")
+                out.append(f"    - {r.path.name}: {r.lines} lines")
         
-        missing_frontmatter = [r for r in results if not r.has_frontmatter]
         if missing_frontmatter:
-            print(f"  • {len(missing_frontmatter)} documents missing frontmatter")
+            out.append(f"  • {len(missing_frontmatter)} documents missing frontmatter")
         
-        missing_toc = [r for r in results if not r.has_toc and r.lines > 60]
         if missing_toc:
-            print(f"  • {len(missing_toc)} large documents missing TOC")
+            out.append(f"  • {len(missing_toc)} large documents missing TOC")
     
-    print("=" * 70)
+    out.append("=" * 70)
+    sys.stdout.write("\n".join(out) + "\n")
     
     return failed
 
 
 def main():
     """Main entry point."""
-    # Parse arguments
-    verbose = "-v" in sys.argv or "--verbose" in sys.argv
-    args = [a for a in sys.argv[1:] if not a.startswith("-")]
+    # Parse arguments in a single pass
+    verbose = False
+    args = []
+    for arg in sys.argv[1:]:
+        if arg in ("-v", "--verbose"):
+            verbose = True
+        elif not arg.startswith("-"):
+            args.append(arg)
     
     if not args:
         # Default: check docs/ and .knowledge/
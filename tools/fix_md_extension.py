@@ -3,19 +3,67 @@
 
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Pattern to match .MD at end of words (file references)
+_MD_RE = re.compile(r'\.MD(?=[\s\)\]\"\'\`\,\;\:\|\#]|$)')
+
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_SKIP_DIRS = frozenset({'.git', '__pycache__', 'node_modules'})
+
+
+def _find_md_files(root='.'):
+    """Collect .md file paths under root, pruning _SKIP_DIRS.
+
+    Uses os.scandir so file types come from the directory entries instead of
+    a stat call per file.
+    """
+    md_files = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file() and entry.name.endswith('.md'):
+                    md_files.append(entry.path)
+    return md_files
+
+
+def _fix_file(filepath):
+    """Replace .MD with .md in one file.
+
+    Returns (replacements, error); error is None on success.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+
+        # Most files have no .MD at all; skip decoding and the regex scan
+        if b'.MD' not in raw:
+            return 0, None
+        content = raw.decode('utf-8')
+
+        # Replace .MD with .md and count in a single pass
+        new_content, count = _MD_RE.subn('.md', content)
+
+        if count:
+            # newline='' writes the decoded line endings back unchanged
+            with open(filepath, 'w', encoding='utf-8', newline='') as f:
+                f.write(new_content)
+
+        return count, None
+
+    except Exception as e:
+        return 0, e
 
 
 def fix_md_extensions():
     """Replace .MD with .md in all markdown files."""
     # Get all .md files
-    md_files = []
-    for root, dirs, files in os.walk('.'):
-        # Skip .git directory
-        if '.git' in root:
-            continue
-        for f in files:
-            if f.endswith('.md'):
-                md_files.append(os.path.join(root, f))
+    md_files = _find_md_files()
 
     print(f'Found {len(md_files)} .md files')
 
@@ -23,29 +71,15 @@ def fix_md_extensions():
     updated_files = 0
     total_replacements = 0
 
-    # Pattern to match .MD at end of words (file references)
-    pattern = r'\.MD(?=[\s\)\]\"\'\`\,\;\:\|\#]|$)'
-
-    for filepath in md_files:
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Count matches before replacement
-            matches = re.findall(pattern, content)
-            
-            if matches:
-                # Replace .MD with .md
-                new_content = re.sub(pattern, '.md', content)
-                
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                
-                total_replacements += len(matches)
+    # Per-file work is blocking I/O, so threads overlap it despite the GIL
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        results = executor.map(_fix_file, md_files)
+        for filepath, (count, error) in zip(md_files, results, strict=True):
+            if error is not None:
+                print(f'Error: {filepath} -> {error}')
+            elif count:
+                total_replacements += count
                 updated_files += 1
-                
-        except Exception as e:
-            print(f'Error: {filepath} -> {e}')
 
     print(f'Updated {updated_files} files')
     print(f'Total replacements: {total_replacements}')
@@ -1,53 +1,109 @@
 #!/usr/bin/env python3
 """Remove frontmatter metadata from all .knowledge markdown files."""
 
+import glob
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _frontmatter_end(text):
+    """Return the offset just past the closing '---' line, or None.
+
+    The first line of text must be '---' (surrounding whitespace allowed); the
+    block closes at the next line that is '---' once stripped. Candidates are
+    located with str.find rather than by splitting the file into lines.
+    """
+    first_nl = text.find('\n')
+    if first_nl < 0 or text[:first_nl].strip() != '---':
+        return None
+
+    idx = text.find('---', first_nl + 1)
+    while idx >= 0:
+        line_start = text.rfind('\n', 0, idx) + 1
+        line_end = text.find('\n', idx)
+        if line_end < 0:
+            line_end = len(text)
+        if text[line_start:line_end].strip() == '---':
+            return line_end + 1
+        idx = text.find('---', line_end)
+    return None
+
+
+def _strip_frontmatter(md_file):
+    """Remove YAML frontmatter from one file.
+
+    Returns (updated, error); error is None on success.
+    """
+    try:
+        # Read raw bytes
+        raw_bytes = md_file.read_bytes()
+        
+        # Remove BOM if present (can be multiple); slice once at the end
+        start = 0
+        while raw_bytes.startswith(b'\xef\xbb\xbf', start):
+            start += 3
+        raw_bytes = raw_bytes[start:]
+        
+        # Cheap prefilter before decoding: a leading ASCII non-space byte that
+        # doesn't open '---' rules frontmatter out. Anything less certain (short
+        # head, non-ASCII lead that str.lstrip() might strip) takes the full path.
+        head = raw_bytes[:256].lstrip()
+        if (
+            len(head) >= 3
+            and head[0] < 0x80
+            and not chr(head[0]).isspace()
+            and not head.startswith(b'---')
+        ):
+            return False, None
+        
+        # Decode to string
+        content = raw_bytes.decode('utf-8')
+        
+        # Check if starts with frontmatter
+        stripped = content.lstrip()
+        if stripped.startswith('---'):
+            body_start = _frontmatter_end(stripped)
+            if body_start is not None:
+                # Remove frontmatter
+                new_content = stripped[body_start:].lstrip()
+                
+                # Write back without BOM
+                md_file.write_text(new_content, encoding='utf-8')
+                return True, None
+                        
+    except Exception as e:
+        return False, e
+
+    return False, None
+
 
 def remove_frontmatter():
     """Remove YAML frontmatter from markdown files."""
     knowledge_dir = Path('.knowledge')
     updated = 0
     
-    for md_file in knowledge_dir.rglob('*.md'):
-        try:
-            # Read raw bytes
-            raw_bytes = md_file.read_bytes()
-            
-            # Remove BOM if present (can be multiple)
-            while raw_bytes.startswith(b'\xef\xbb\xbf'):
-                raw_bytes = raw_bytes[3:]
-            
-            # Decode to string
-            content = raw_bytes.decode('utf-8')
-            
-            # Check if starts with frontmatter
-            stripped = content.lstrip()
-            if stripped.startswith('---'):
-                # Find the closing ---
-                lines = stripped.split('\n')
-                if lines[0].strip() == '---':
-                    # Find second ---
-                    end_idx = None
-                    for i, line in enumerate(lines[1:], 1):
-                        if line.strip() == '---':
-                            end_idx = i
-                            break
-                    
-                    if end_idx is not None:
-                        # Remove frontmatter
-                        new_lines = lines[end_idx + 1:]
-                        new_content = '\n'.join(new_lines).lstrip()
-                        
-                        # Write back without BOM
-                        md_file.write_text(new_content, encoding='utf-8')
-                        updated += 1
-                        if updated <= 25:
-                            print(f'  Updated: {md_file}')
-                            
-        except Exception as e:
-            print(f'  Error: {md_file} - {e}')
+    # iglob yields str paths; Path objects are only built for markdown files
+    pattern = str(knowledge_dir / '**' / '*.md')
+    md_files = [
+        Path(path_str)
+        for path_str in glob.iglob(pattern, recursive=True, include_hidden=True)
+        if f'{os.sep}.git{os.sep}' not in path_str
+    ]
+
+    # Per-file work is blocking I/O, so threads overlap it despite the GIL
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        results = executor.map(_strip_frontmatter, md_files)
+        for md_file, (changed, error) in zip(md_files, results, strict=True):
+            if error is not None:
+                print(f'  Error: {md_file} - {error}')
+            elif changed:
+                updated += 1
+                if updated <= 25:
+                    print(f'  Updated: {md_file}')
     
     print(f'\nTotal updated: {updated} files')
 